@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 
-from types import TupleType
 import math, sys
 import itertools, operator
 
@@ -86,7 +85,7 @@ class Location(dict):
             <Location crackle:0, pop:1, snap:0 >
         """
         for k in axisNames:
-            if not self.has_key(k):
+            if k not in self:
                 self[k] = 0
     
     def copy(self):
@@ -131,8 +130,7 @@ class Location(dict):
             (('pop', 1), ('snap', -100))
         """
         t = []
-        k = self.keys()
-        k.sort()
+        k = sorted(self.keys())
         for key in k:
             t.append((key, self[key]))
         return tuple(t)
@@ -228,8 +226,8 @@ class Location(dict):
         ::
         
             >>> l = Location(pop=1, snap=-100)
-            >>> l.asDict()
-            {'snap': -100, 'pop': 1}
+            >>> l.asDict() == {'snap': -100, 'pop': 1}
+            True
         """
         new = {}
         new.update(self)
@@ -240,13 +238,12 @@ class Location(dict):
         ::
 
             >>> l = Location(pop=1, snap=(1,10))
-            >>> l.asSortedStringDict()
-            [{'value': '1', 'axis': 'pop'}, {'value': '(1,10)', 'axis': 'snap'}]
-            
+            >>> l.asSortedStringDict() == [{'value': '1', 'axis': 'pop'}, {'value': '(1,10)', 'axis': 'snap'}]
+            True
+
         """
         data = []
-        names = self.keys()
-        names.sort()
+        names = sorted(self.keys())
         for n in names:
             data.append({'axis':n, 'value':numberToString(self[n])})
         return data
@@ -261,7 +258,14 @@ class Location(dict):
             <Location pop:1 >
             
         """
-        return self.__class__([(k, v) for k, v in self.items() if v > _EPSILON or v < -_EPSILON])
+        new = self.__class__()
+        for k, v in self.items():
+            if type(v) == tuple:
+                if v[0] > _EPSILON or v[0] < -_EPSILON or v[1] > _EPSILON or v[1] < -_EPSILON:
+                    new[k] = v
+            elif v > _EPSILON or v < -_EPSILON:
+                new[k] = v
+        return new
     
     def common(self, other):
         """
@@ -320,7 +324,10 @@ class Location(dict):
             True
         """
         for name, value in self.items():
-            if value < -_EPSILON or value > _EPSILON:
+            if type(value) == tuple:
+                if value[0] < -_EPSILON or value[0] > _EPSILON or value[1] < -_EPSILON or value[1] > _EPSILON:
+                    return False
+            elif value < -_EPSILON or value > _EPSILON:
                 return False
         return True
         
@@ -346,7 +353,7 @@ class Location(dict):
         new = self.__class__()
         new.update(self)
         s = new.strip()
-        dims = s.keys()
+        dims = list(s.keys())
         if len(dims)> 1:
             return False
         elif len(dims)==1:
@@ -367,12 +374,12 @@ class Location(dict):
         """
         if dim is not None:
             try:
-                return type(self[dim]) == TupleType
+                return type(self[dim]) == tuple
             except KeyError:
                 # dimension is not present, it should be 0, so not ambivalent
                 return False
         for dim, val in self.items():
-            if type(val) == TupleType:
+            if type(val) == tuple:
                 return True
         return False
     
@@ -388,7 +395,7 @@ class Location(dict):
         x = self.__class__()
         y = self.__class__()
         for dim, val in self.items():
-            if type(val) == TupleType:
+            if type(val) == tuple:
                 x[dim] = val[0]
                 y[dim] = val[1]
             else:
@@ -407,7 +414,7 @@ class Location(dict):
         """
         new = self.__class__()
         for dim, val in self.items():
-            if type(val) == TupleType:
+            if type(val) == tuple:
                 new[dim] = val[0]
             else:
                 new[dim] = val
@@ -424,7 +431,7 @@ class Location(dict):
         """
         new = self.__class__()
         for dim, val in self.items():
-            if type(val) == TupleType:
+            if type(val) == tuple:
                 new[dim] = val[1]
             else:
                 new[dim] = val
@@ -554,7 +561,7 @@ class Location(dict):
     
     __rmul__ = __mul__
     
-    def __div__(self, factor):
+    def __truediv__(self, factor):
         if factor == 0:
             raise ZeroDivisionError
         if isinstance(factor, tuple):
@@ -562,6 +569,13 @@ class Location(dict):
                 raise ZeroDivisionError
             return self * (1.0/factor[0]) + self * (1.0/factor[1])
         return self * (1.0/factor)
+
+    __div__ = __truediv__
+
+    def __lt__(self, other):
+        # Locations sort by dimensionality first, then by sorted
+        # axis name and value, like tuples of dicts used to.
+        return (len(self), self.asTuple()) < (len(other), other.asTuple())
     
     def transform(self, transformDict):
         if transformDict is None:
@@ -593,7 +607,7 @@ def sortLocations(locations):
         if l.isOnAxis():
             onAxis.append(l)
             for axis in l.keys():
-                if not onAxisValues.has_key(axis):
+                if axis not in onAxisValues:
                     onAxisValues[axis] = []
                 onAxisValues[axis].append(l[axis])
         else:
@@ -601,7 +615,7 @@ def sortLocations(locations):
     for l in offAxis:
         ok = False
         for axis in l.keys():
-            if not onAxisValues.has_key(axis):
+            if axis not in onAxisValues:
                 continue
             if l[axis] in onAxisValues[axis]:
                 ok = True
@@ -1030,8 +1044,8 @@ if __name__ == "__main__":
         >>> l = [a, b, c, d, e, f]
         >>> test = Location(pop=.5, snap=.5)
         >>> from mutatorMath.objects.mutator import getLimits
-        >>> getLimits(l, test)
-        {'snap': (None, 0.5, None), 'pop': (0.35, None, 1)}
+        >>> getLimits(l, test) == {'snap': (None, 0.5, None), 'pop': (0.35, None, 1)}
+        True
 
         # sort a group of locations
         >>> sortLocations(l)
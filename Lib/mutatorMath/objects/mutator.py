@@ -3,6 +3,7 @@
 from mutatorMath.objects.error import MutatorError
 from mutatorMath.objects.location import Location, sortLocations, biasFromLocations
 
+from bisect import bisect_left, insort
 import sys
 
 __all__ = ['Mutator', 'buildMutator']
@@ -16,25 +17,30 @@ def buildMutator(items):
     """
     m = Mutator()
     # the order itself does not matter, but we should always build in the same order.
-    items.sort()
+    items.sort(key=lambda pair: pair[0].asTuple())
     bias = biasFromLocations([loc for loc, obj in items], True)
     m.setBias(bias)
-    n = None
-    ofx = []
-    onx = []
+    # move each location over the bias only once
+    relativeItems = []
     for loc, obj in items:
-        if (loc-bias).isOrigin():
+        lb = loc-bias
+        relativeItems.append((lb, lb.isOrigin(), obj))
+    neutral = None
+    for lb, isOrigin, obj in relativeItems:
+        if isOrigin:
             m.setNeutral(obj)
+            neutral = obj
             break
-    if m.getNeutral() is None:
+    if neutral is None:
         raise MutatorError("Did not find a neutral for this system", m)
-    for loc, obj in items:
-        lb = loc-bias
-        if lb.isOrigin(): continue
+    ofx = []
+    onx = []
+    for lb, isOrigin, obj in relativeItems:
+        if isOrigin: continue
         if lb.isOnAxis():
-            onx.append((lb, obj-m.getNeutral()))
+            onx.append((lb, obj-neutral))
         else:
-            ofx.append((lb, obj-m.getNeutral()))
+            ofx.append((lb, obj-neutral))
     for loc, obj in onx:
         m.addDelta(loc, obj, punch=False,  axisOnly=True)
     for loc, obj in ofx:
@@ -42,6 +48,23 @@ def buildMutator(items):
     return bias, m
     
 
+class _DeltaRecord(object):
+    """
+        Precomputed data for one delta: the value vector in canonical
+        axis order, the on-axis name and index, the math item and the
+        delta name. A compact slotted record instead of a tuple, so
+        the evaluation loops read named fields without unpacking.
+    """
+    __slots__ = ('vec', 'axisName', 'axisIndex', 'mathItem', 'name')
+
+    def __init__(self, vec, axisName, axisIndex, mathItem, name):
+        self.vec = vec
+        self.axisName = axisName
+        self.axisIndex = axisIndex
+        self.mathItem = mathItem
+        self.name = name
+
+
 class Mutator(dict):
     
     """ 
@@ -65,9 +88,41 @@ class Mutator(dict):
         self._tags = {}
         self._neutral = neutral
         self._bias = Location()
-    
+        self._biasIsOrigin = True
+        self._deltasCache = None
+        self._axisNamesCache = None
+        self._allLocationsCache = None
+        self._axesCacheLen = -1
+        self._axisOrder = []
+        self._axisIndex = {}
+        self._onAxisValues = {}
+        self._limitsCache = {}
+        self._isOnAxisCache = {}
+        self._sortedKeys = []
+        self._zeroCache = None
+
+    def _clearCaches(self):
+        """Invalidate all precomputed delta data. Called when the deltas change."""
+        self._deltasCache = None
+        self._axisNamesCache = None
+        self._allLocationsCache = None
+        self._axesCacheLen = -1
+        self._limitsCache = {}
+
     def setBias(self, bias):
         self._bias = bias
+        self._biasIsOrigin = bias.isOrigin()
+        self._clearCaches()
+
+    def _unbias(self, aLocation):
+        """ Move aLocation over the bias.
+            The deltas are stored bias-relative, so this is decided
+            once at setBias time: with the bias at the origin the
+            subtraction is a plain copy.
+        """
+        if self._biasIsOrigin:
+            return aLocation.copy()
+        return aLocation - self._bias
 
     def getBias(self, bias):
         return self._bias
@@ -75,6 +130,7 @@ class Mutator(dict):
     def setNeutral(self, aMathObject, deltaName="origin"):
         """Set the neutral object."""
         self._neutral = aMathObject
+        self._zeroCache = None
         self.addDelta(Location(), aMathObject-aMathObject, deltaName, punch=False, axisOnly=True)
     
     def getNeutral(self):
@@ -90,15 +146,21 @@ class Mutator(dict):
                 *   True: add the difference with the instance value at that location and the delta
                 *   False: just add the delta.
         """
+        locationTuple = location.asTuple()
+        isNewKey = locationTuple not in self
         if punch:
             r = self.getInstance(location, axisOnly=axisOnly)
             if r is not None:
-                self[location.asTuple()] = aMathObject-r, deltaName
+                self[locationTuple] = aMathObject-r, deltaName
             else:
-                raise mutator.error.MutatorError()
+                raise MutatorError("Could not get an instance to punch", location)
         else:
-            self[location.asTuple()] = aMathObject, deltaName
-                
+            self[locationTuple] = aMathObject, deltaName
+        if isNewKey:
+            insort(self._sortedKeys, locationTuple)
+        self._isOnAxisCache[locationTuple] = location.isOnAxis()
+        self._clearCaches()
+
     #
     # info
     #       
@@ -107,23 +169,51 @@ class Mutator(dict):
         """
             Collect a list of axis names from all deltas.
         """
-        s = {}
-        for l, x in self.items():
-            s.update(dict.fromkeys([k for k, v in l], None))
-        return s.keys()
-        
+        if self._axisNamesCache is None:
+            s = {}
+            for l, x in self.items():
+                s.update(dict.fromkeys([k for k, v in l], None))
+            self._axisNamesCache = list(s.keys())
+        return self._axisNamesCache
+
+    def _isOnAxis(self, locationTuple):
+        """
+            isOnAxis for a stored location tuple, cached at addDelta
+            time so the collect helpers do not rebuild a Location for
+            every key.
+        """
+        try:
+            return self._isOnAxisCache[locationTuple]
+        except KeyError:
+            name = Location(locationTuple).isOnAxis()
+            self._isOnAxisCache[locationTuple] = name
+            return name
+
     def _collectAxisPoints(self):
-        """ 
+        """
             Return a dictionary with all on-axis locations.
+            Memoized on the number of deltas, so repeated getInstance
+            calls on an unchanged mutator skip the rescan.
+            Also builds, per axis, the sorted table of on-axis values
+            (the origin included) that the on-axis factor calculation
+            interpolates between.
         """
-        for l, (value, deltaName) in self.items():
-            location = Location(l)
-            name = location.isOnAxis()
-            if name is not None and name is not False:
-                if not self._axes.has_key(name):
-                    self._axes[name] = []
-                if l not in self._axes[name]:
-                    self._axes[name].append(l)
+        if self._axesCacheLen != len(self):
+            for l in self.keys():
+                name = self._isOnAxis(l)
+                if name is not None and name is not False:
+                    if l not in self._axes.setdefault(name, []):
+                        self._axes[name].append(l)
+            self._onAxisValues = {}
+            for name, locationTuples in self._axes.items():
+                iv = {0: 1}
+                for locationTuple in locationTuples:
+                    for axisName, axisValue in locationTuple:
+                        if axisName == name:
+                            iv[axisValue] = 1
+                            break
+                self._onAxisValues[name] = sorted(iv)
+            self._axesCacheLen = len(self)
         return self._axes
     
     def _collectOffAxisPoints(self):
@@ -131,14 +221,42 @@ class Mutator(dict):
             Return a dictionary with all off-axis locations.
         """
         offAxis = {}
-        for l, (value, deltaName) in self.items():
-            location = Location(l)
-            name = location.isOnAxis()
+        for l in self.keys():
+            name = self._isOnAxis(l)
             if name is None or name is False:
                 offAxis[l] = 1
-        return offAxis.keys()
+        return list(offAxis.keys())
     
 
+    def _collectDeltas(self):
+        """
+            Return a list of _DeltaRecord objects, in sorted key order.
+            The value vector holds the per-axis values in the canonical
+            axis order, so the factor calculations index by position
+            instead of looking up axis names in a Location. The list is
+            rebuilt after addDelta, so repeated factor calculations do
+            not construct Location objects in the hot loop.
+        """
+        if self._deltasCache is None:
+            self._axisOrder = sorted(self.getAxisNames())
+            self._axisIndex = dict([(name, i) for i, name in enumerate(self._axisOrder)])
+            if len(self._sortedKeys) != len(self):
+                # deltas were inserted without going through addDelta
+                self._sortedKeys = sorted(self.keys())
+            deltas = []
+            for deltaLocationTuple in self._sortedKeys:
+                mathItem, deltaName = self[deltaLocationTuple]
+                deltaLocation = Location(deltaLocationTuple)
+                deltaAxis = self._isOnAxis(deltaLocationTuple)
+                deltaVec = [deltaLocation.get(name, 0) for name in self._axisOrder]
+                if deltaAxis:
+                    deltaAxisIdx = self._axisIndex[deltaAxis]
+                else:
+                    deltaAxisIdx = -1
+                deltas.append(_DeltaRecord(deltaVec, deltaAxis, deltaAxisIdx, mathItem, deltaName))
+            self._deltasCache = deltas
+        return self._deltasCache
+
     def collectLocations(self):
         """
             Return a dictionary with all objects.
@@ -152,10 +270,12 @@ class Mutator(dict):
         """
             Return a list of all locations of all objects.
         """
-        l = [] 
-        for locationTuple in self.keys():
-            l.append(Location(locationTuple))
-        return l
+        if self._allLocationsCache is None:
+            l = []
+            for locationTuple in self.keys():
+                l.append(Location(locationTuple))
+            self._allLocationsCache = l
+        return self._allLocationsCache
             
     #
     #   get instances
@@ -170,8 +290,12 @@ class Mutator(dict):
             *   getFactors:
                 *   True: return a list of the calculated factors.
         """
-        self._collectAxisPoints()
-        factors = self.getFactors(aLocation, axisOnly)
+        if getFactors:
+            factors = self.getFactors(aLocation, axisOnly)
+        else:
+            # fused path: accumulate the deltas as the factors are
+            # calculated, without materialising and sorting the list.
+            factors = self._iterFactors(aLocation, axisOnly)
         total = None
         for f, item, name in factors:
             if total is None:
@@ -179,20 +303,35 @@ class Mutator(dict):
                 continue
             total += f * item
         if total is None:
-            total = 0 * self._neutral
+            # nothing contributed: a zero object, scaled from the
+            # neutral once and reused for later empty queries.
+            if self._zeroCache is None:
+                self._zeroCache = 0 * self._neutral
+            total = self._zeroCache
         if getFactors:
             return total, factors
         return total
 
+    def getInstances(self, aLocations, axisOnly=False):
+        """ Calculate the deltas at each location in aLocations.
+            Returns a list of instance objects, one per location.
+            The precomputed tables and the limits cache are shared
+            between the evaluations, so sweeping a designspace this
+            way only pays the per-location factor math.
+        """
+        self._collectAxisPoints()
+        self._collectDeltas()
+        return [self.getInstance(aLocation, axisOnly=axisOnly) for aLocation in aLocations]
+
     def makeInstance(self, aLocation):
         """ 
             Calculate an instance with the right bias and add the neutral. 
         """
         if not aLocation.isAmbivalent():
-            instanceObject = self.getInstance(aLocation-self._bias)
+            instanceObject = self.getInstance(self._unbias(aLocation))
         else:
             locX, locY = aLocation.split()
-            instanceObject = self.getInstance(locX-self._bias)*(1,0)+self.getInstance(locY-self._bias)*(0,1)
+            instanceObject = self.getInstance(self._unbias(locX))*(1,0)+self.getInstance(self._unbias(locY))*(0,1)
         return instanceObject+self._neutral
 
     def getFactors(self, aLocation, axisOnly=False):
@@ -200,44 +339,60 @@ class Mutator(dict):
             Return a list of all factors and math items at aLocation.
             factor, mathItem, deltaName
         """
-        deltas = []
+        deltas = list(self._iterFactors(aLocation, axisOnly))
+        # largest contribution first; the key never compares the math
+        # items themselves and ties keep the sorted delta order.
+        deltas.sort(key=lambda t: abs(t[0]), reverse=True)
+        return deltas
+
+    def _iterFactors(self, aLocation, axisOnly=False):
+        """
+            Generate (factor, mathItem, deltaName) for every delta with
+            a non-zero factor at aLocation, in sorted delta order.
+        """
+        self._collectAxisPoints()
         aLocation.expand(self.getAxisNames())
-        limits = getLimits(self._allLocations(), aLocation)
-        for deltaLocationTuple, (mathItem, deltaName) in sorted(self.iteritems()):
-            deltaLocation = Location(deltaLocationTuple)
-            deltaLocation.expand( self.getAxisNames())
-            factor = self._accumulateFactors(aLocation, deltaLocation, limits, axisOnly)
+        collected = self._collectDeltas()
+        aVec = [aLocation[name] for name in self._axisOrder]
+        # getLimits projects every delta onto aLocation; the result only
+        # depends on aLocation, so keep it per location tuple.
+        limitsKey = tuple(aVec)
+        limitItems = self._limitsCache.get(limitsKey)
+        if limitItems is None:
+            limits = getLimits(self._allLocations(), aLocation)
+            limitItems = [(self._axisIndex[dim], lims) for dim, lims in limits.items()]
+            self._limitsCache[limitsKey] = limitItems
+        for delta in collected:
+            deltaAxis = delta.axisName
+            if deltaAxis is False:
+                if axisOnly:
+                    continue
+            elif deltaAxis is not None and deltaAxis != "origin" and aVec[delta.axisIndex] == 0:
+                # the origin is always a sample point, so an on-axis
+                # delta has no influence when the instance sits at the
+                # origin of its axis.
+                continue
+            factor = self._accumulateFactors(aVec, delta.vec, deltaAxis, delta.axisIndex, limitItems, axisOnly)
             if not (factor-_EPSILON < 0 < factor+_EPSILON):
-                # only add non-zero deltas.
-                deltas.append((factor, mathItem, deltaName))    
-        deltas.sort()
-        deltas.reverse()
-        return deltas
+                # only yield non-zero deltas.
+                yield factor, delta.mathItem, delta.name
 
     #
     #   calculate
     #
 
-    def _accumulateFactors(self, aLocation, deltaLocation, limits, axisOnly):
+    def _accumulateFactors(self, aVec, deltaVec, deltaAxis, deltaAxisIdx, limitItems, axisOnly):
         """
-            Calculate the factors of deltaLocation towards aLocation,
+            Calculate the factors of the delta vector towards the instance vector.
         """
         relative = []
-        deltaAxis = deltaLocation.isOnAxis()
         if deltaAxis is None:
             relative.append(1)
         elif deltaAxis:
-            deltasOnSameAxis = self._axes.get(deltaAxis, None)
-            d = ((deltaAxis, 0),)
-            if d not in deltasOnSameAxis:
-                deltasOnSameAxis.append(d)
-            if len(deltasOnSameAxis) == 1:
-                relative.append(aLocation[deltaAxis] * deltaLocation[deltaAxis])
-            else:
-                factor =  self._calcOnAxisFactor(aLocation, deltaAxis, deltasOnSameAxis, deltaLocation)
-                relative.append(factor)
+            factor = self._calcOnAxisFactor(aVec[deltaAxisIdx], deltaVec[deltaAxisIdx], deltaAxis, self._onAxisValues[deltaAxis])
+            relative.append(factor)
         elif not axisOnly:
-            factor = self._calcOffAxisFactor(aLocation, deltaLocation, limits)
+            factor = _calcOffAxisFactor(aVec, deltaVec, limitItems)
             relative.append(factor)
         if not relative:
             return 0
@@ -248,183 +403,160 @@ class Mutator(dict):
                 f *= v
         return f
 
-    def _calcOnAxisFactor(self, aLocation, deltaAxis, deltasOnSameAxis, deltaLocation):
-        """ 
+    def _calcOnAxisFactor(self, f, v, deltaAxis, onAxisValues):
+        """
             Calculate the on-axis factors.
+            onAxisValues is the precomputed, sorted table of on-axis
+            values for this axis, built in _collectAxisPoints.
+            The neighbors of f are found with a binary search instead
+            of partitioning the whole table on every call.
         """
         if deltaAxis == "origin":
             f = 0
             v = 0
-        else:
-            f = aLocation[deltaAxis]
-            v = deltaLocation[deltaAxis]
-        i = []
-        iv = {}
-        for value in deltasOnSameAxis:
-            iv[Location(value)[deltaAxis]]=1
-        i = iv.keys()
-        i.sort()
-        r = 0
-        B, M, A = [], [], []
-        mA, mB, mM = None, None, None
-        for value in i:
-            if value < f: B.append(value)
-            elif value > f: A.append(value)
-            else: M.append(value)
-        if len(B) > 0:
-            mB = max(B)
-            B.sort()
-        if len(A) > 0:
-            mA = min(A)
-            A.sort()
-        if len(M) > 0:
-            mM = min(M)
-            M.sort()
-        if mM is not None:
-            if ((f-_EPSILON <  v) and (f+_EPSILON > v)) or f==v: r = 1
-            else: r = 0
-        elif mB is not None and mA is not None:
-            if v < mB or v > mA: r = 0
-            else:
-                if v == mA:
-                    r = float(f-mB)/(mA-mB)
-                else:
-                    r = float(f-mA)/(mB-mA)
-        elif mB is None and mA is not None:
-            if v==A[1]:
-                r = float(f-A[0])/(A[1]-A[0])
-            elif v == A[0]:
-                r = float(f-A[1])/(A[0]-A[1])
-            else:
-                r = 0
-        elif  mB is not None and mA is None:
-            if v == B[-2]:
-                r = float(f-B[-1])/(B[-2]-B[-1])
-            elif v == mB:
-                r = float(f-B[-2])/(B[-1]-B[-2])
-            else:
-                r = 0
-        return r
+        n = len(onAxisValues)
+        idx = bisect_left(onAxisValues, f)
+        if idx < n and onAxisValues[idx] == f:
+            # on a sample point
+            if ((f-_EPSILON <  v) and (f+_EPSILON > v)) or f==v:
+                return 1
+            return 0
+        if 0 < idx < n:
+            # between two sample points
+            mB = onAxisValues[idx-1]
+            mA = onAxisValues[idx]
+            if v < mB or v > mA:
+                return 0
+            if v == mA:
+                return (f-mB)/(mA-mB)
+            return (f-mA)/(mB-mA)
+        if idx == 0:
+            # extrapolation below the smallest sample
+            if v == onAxisValues[1]:
+                return (f-onAxisValues[0])/(onAxisValues[1]-onAxisValues[0])
+            if v == onAxisValues[0]:
+                return (f-onAxisValues[1])/(onAxisValues[0]-onAxisValues[1])
+            return 0
+        # extrapolation above the largest sample
+        if v == onAxisValues[-2]:
+            return (f-onAxisValues[-1])/(onAxisValues[-2]-onAxisValues[-1])
+        if v == onAxisValues[-1]:
+            return (f-onAxisValues[-2])/(onAxisValues[-1]-onAxisValues[-2])
+        return 0
 
-    def _calcOffAxisFactor(self, aLocation, deltaLocation, limits):
-        """ 
-            Calculate the off-axis factors.
-        """
-        relative = []
-        for dim in limits.keys():
-            f = aLocation[dim]
-            v = deltaLocation[dim]
-            mB, M, mA = limits[dim]
-            r = 0
-            if mA is not None and v > mA:
-                relative.append(0)
-                continue
-            elif mB is not None and v < mB:
-                relative.append(0)
-                continue
-            if f < v-_EPSILON:
-                if mB is None:
-                    if M is not None and mA is not None:
-                        if v == M:
-                            r = (float(max(f,mA)-min(f, mA))/float(max(M,mA)-min(M, mA)))
-                        else:
-                            r = -(float(max(f,mA)-min(f, mA))/float(max(M,mA)-min(M, mA)) -1)
-                    else: r = 0
-                elif mA is None: r = 0
-                else: r = float(f-mB)/(mA-mB)
-            elif f > v+_EPSILON:
-                if mB is None: r = 0
-                elif mA is None:
-                    if M is not None and mB is not None:
-                        if v == M:
-                            r = (float(max(f,mB)-min(f, mB))/(max(mB, M)-min(mB, M)))
-                        else:
-                            r = -(float(max(f,mB)-min(f, mB))/(max(mB, M)-min(mB, M)) - 1)
-                    else: r = 0
-                else: r = float(mA-f)/(mA-mB)
-            else: r = 1
-            relative.append(r)
-        f = 1
-        for i in relative:
-            f *= i
-        return f
+
+def _calcOffAxisFactor(aVec, deltaVec, limitItems):
+    """
+        Calculate the off-axis factor for one delta.
+        A module level function on plain values and integer indices:
+        no attribute lookups or object construction in the loop, and
+        in the shape a compiler could take on without changes.
+    """
+    factor = 1
+    for dim, (mB, M, mA) in limitItems:
+        f = aVec[dim]
+        v = deltaVec[dim]
+        if mA is not None and v > mA:
+            return 0
+        elif mB is not None and v < mB:
+            return 0
+        if f < v-_EPSILON:
+            if mB is None:
+                if M is not None and mA is not None:
+                    if v == M:
+                        r = abs(f-mA)/abs(M-mA)
+                    else:
+                        r = -(abs(f-mA)/abs(M-mA) -1)
+                else: r = 0
+            elif mA is None: r = 0
+            else: r = (f-mB)/(mA-mB)
+        elif f > v+_EPSILON:
+            if mB is None: r = 0
+            elif mA is None:
+                if M is not None and mB is not None:
+                    if v == M:
+                        r = abs(f-mB)/abs(mB-M)
+                    else:
+                        r = -(abs(f-mB)/abs(mB-M) - 1)
+                else: r = 0
+            else: r = (mA-f)/(mA-mB)
+        else: r = 1
+        factor *= r
+    return factor
 
 def getLimits(locations, current, sortResults=True, verbose=False):
     """ 
         Find the projections for each delta in the list of locations, relative to the current location.
         Return only the dimensions that are relevant for current. 
     """
+    # per axis: a flat triple of value -> locations dicts for the
+    # values below, at and above the current location.
     limit = {}
     for l in locations:
         a, b = current.common(l)
         if a is None:
             continue
         for name, value in b.items():
-            f = a[name]
-            if not limit.has_key(name):
-                limit[name] = {}
-                limit[name]['<'] = {}
-                limit[name]['='] = {}
-                limit[name]['>'] = {}
+            if name not in limit:
+                below, equal, above = {}, {}, {}
+                f = a[name]
                 if f > 0:
-                    limit[name]['>'] = {0: [Location()]}
-                elif f<0:
-                    limit[name]['<'] = {0: [Location()]}
+                    below[0] = [Location()]
+                elif f < 0:
+                    above[0] = [Location()]
                 else:
-                    limit[name]['='] = {0: [Location()]}
-            if current[name] < value - _EPSILON:
-                if not limit[name]["<"].has_key(value):
-                    limit[name]["<"][value] = []
-                limit[name]["<"][value].append(l)
-            elif current[name] > value + _EPSILON:
-                if not limit[name][">"].has_key(value):
-                    limit[name][">"][value] = []
-                limit[name][">"][value].append(l)
+                    equal[0] = [Location()]
+                limit[name] = below, equal, above
+            else:
+                below, equal, above = limit[name]
+            f = current[name]
+            if f < value - _EPSILON:
+                above.setdefault(value, []).append(l)
+            elif f > value + _EPSILON:
+                below.setdefault(value, []).append(l)
             else:
-                if not limit[name]["="].has_key(value):
-                    limit[name]["="][value] = []
-                limit[name]["="][value].append(l)
+                equal.setdefault(value, []).append(l)
     if not sortResults:
-        return limit
+        # legacy nested form
+        nested = {}
+        for name, (below, equal, above) in limit.items():
+            nested[name] = {'<': above, '=': equal, '>': below}
+        return nested
     # now we have all the data, let's sort to the relevant values
     l = {}
-    for name, lims in  limit.items():
-        less = []
-        more = []
-        if lims[">"].keys():
-            less = lims[">"].keys()
-            less.sort()
-            lim_min = less[-1]
+    for name, (below, equal, above) in limit.items():
+        if below:
+            lim_min = max(below)
         else:
             lim_min = None
-        if lims["<"].keys():
-            more = lims["<"].keys()
-            more.sort()
-            lim_max = more[0]
+        if above:
+            lim_max = min(above)
         else:
             lim_max = None
         if lim_min is None and lim_max is not None:
             # extrapolation < min
-            if len(limit[name]['='])>0:
-                l[name] = (None,  limit[name]['='].keys()[0], None)
-            elif len(more) > 1 and len(limit[name]['='])==0:
+            if equal:
+                l[name] = (None, list(equal)[0], None)
+            elif len(above) > 1:
                 # extrapolation
-                l[name] = (None,  more[0], more[1])
+                s = sorted(above)
+                l[name] = (None, s[0], s[1])
         elif lim_min is not None and lim_max is None:
             # extrapolation < max
-            if len(limit[name]['='])>0:
-                # less > 0, M > 0, more = None
+            if equal:
+                # below > 0, M > 0, above = None
                 # -> end of a limit
-                l[name] = (None, limit[name]['='], None)
-            elif len(less) > 1 and len(limit[name]['='])==0:
-                # less > 0, M = None, more = None
+                l[name] = (None, equal, None)
+            elif len(below) > 1:
+                # below > 0, M = None, above = None
                 # extrapolation
-                l[name] = (less[-2], less[-1], None)
+                s = sorted(below)
+                l[name] = (s[-2], s[-1], None)
         else:
-            if len(limit[name]['=']) > 0:
-                l[name] = (None,  limit[name]['='].keys()[0], None)
+            if equal:
+                l[name] = (None, list(equal)[0], None)
             else:
-                l[name] = (lim_min,  None, lim_max)
+                l[name] = (lim_min, None, lim_max)
     return l
         
 if __name__ == "__main__":
@@ -561,11 +693,22 @@ if __name__ == "__main__":
         test  = Location(pop=t)
         print(getLimits(locations, test))
     
+    def test_batch():
+        """ Test the batch instance calculation.
+
+        >>> m = Mutator()
+        >>> neutral = 0
+        >>> m.setNeutral(neutral-neutral)
+        >>> m.addDelta(Location(pop=1), 100.0-neutral, deltaName="test")
+        >>> m.getInstances([Location(pop=0.5), Location(pop=1), Location(pop=2)])
+        [50.0, 100.0, 200.0]
+        """
+
     def test_methods():
         """ Test some of the methods.
         >>> m = test_methods()
         >>> m.getAxisNames()
-        ['snap', 'pop']
+        ['pop', 'snap']
         """
         m = Mutator()
         neutral = 0